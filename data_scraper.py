@@ -1,19 +1,147 @@
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 import requests
+import soupsieve as sv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import atexit
 import json
-import time
+import queue
 import re
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+
+try:
+    import requests_cache
+except ImportError:  # optional: without it every run goes to the network
+    requests_cache = None
+
+
+def make_soup(markup: str) -> BeautifulSoup:
+    """Parse markup with lxml, falling back to html.parser if lxml is not installed."""
+
+    try:
+        return BeautifulSoup(markup, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(markup, "html.parser")
+
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Build the shared keep-alive session on first use."""
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            if requests_cache is not None:
+                # repeat runs read thread pages from disk; 406s are cached too so we go straight to the snapshot fallback
+                _SESSION = requests_cache.CachedSession(
+                    Path(__file__).with_name("tgp_cache.sqlite"), expire_after=3600, allowable_codes=(200, 406)
+                )
+            else:
+                _SESSION = requests.Session()
+            _SESSION.mount(
+                "https://",
+                HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3)),
+            )
+        return _SESSION
+
+
+_SEL_POST = sv.compile("article.message")
+_SEL_TITLE = sv.compile("h1.p-title-value")
+_SEL_AUTHOR = sv.compile("a.username")
+_SEL_TIME = sv.compile("time.u-dt")
+_SEL_BODY = sv.compile(".bbWrapper")
+
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.woff*", "*.css", "*.svg", "*.mp4",
+    # XenForo serves its stylesheets from css.php?css=..., which "*.css" never matches
+    "*css.php*",
+    "*/analytics*", "*/gtag*",
+]
+
+_DRIVER_POOL_SIZE = 4
+_DRIVER_POOLS: dict[bool, "queue.Queue[Chrome]"] = {}
+
+
+def create_driver(headless: bool = False) -> Chrome:
+    """Create a Chrome driver instance configured for scraping."""
+
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # we only ever read the markup, so skip images, fonts and stylesheets
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.cookies": 1,
+    })
+
+    driver = webdriver.Chrome(options=chrome_options)
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
+        driver.execute_cdp_cmd("Network.enable", {})
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+
+def _acquire_driver(headless: bool = False) -> Chrome:
+    """Take a warm driver from the pool, starting a new one if none is idle."""
+
+    pool = _DRIVER_POOLS.setdefault(headless, queue.Queue(maxsize=_DRIVER_POOL_SIZE))
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return create_driver(headless)
+
+
+def _release_driver(driver: Chrome, headless: bool = False) -> None:
+    """Reset a driver and hand it back to the pool, quitting it if the pool is full."""
+
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        _DRIVER_POOLS.setdefault(headless, queue.Queue(maxsize=_DRIVER_POOL_SIZE)).put_nowait(driver)
+    except (queue.Full, WebDriverException):
+        # pool is full or the browser already died (e.g. its window was closed)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+@atexit.register
+def _quit_pooled_drivers() -> None:
+    for pool in _DRIVER_POOLS.values():
+        while True:
+            try:
+                pool.get_nowait().quit()
+            except queue.Empty:
+                break
+            except WebDriverException:
+                continue
 
 
 class GearSearchScraper:
     SEARCH_URL = "https://www.thegearpage.net/board/index.php?search/&type=post"
+    SEARCH_POST_URL = "https://www.thegearpage.net/board/index.php?search/search"
+    _AUTHOR_RE = re.compile(r"\[(.*?)\]")
     DEFAULT_HEADERS = {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -25,78 +153,158 @@ class GearSearchScraper:
         self.gear_query = gear_query
         self.headless = headless
         self.timeout = timeout
-        self.driver = self._build_driver()
+        self.driver: Chrome | None = self._build_driver()
 
     def _build_driver(self) -> Chrome:
-        """Create a Chrome driver instance configured for scraping."""
+        """Borrow a Chrome driver from the shared pool."""
+
+        return _acquire_driver(self.headless)
+
+    def close(self) -> None:
+        """Return the driver to the pool so the next scraper skips Chrome start-up."""
+
+        if self.driver is None:
+            return
+        _release_driver(self.driver, self.headless)
+        self.driver = None
 
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+    def __enter__(self) -> "GearSearchScraper":
+        return self
 
-        return webdriver.Chrome(options=chrome_options)
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def open_search_page(self) -> None:
         """Navigate to the search URL."""
 
         self.driver.get("https://www.thegearpage.net/board/index.php?search/&type=post")
 
+    def submit_search(self) -> str | None:
+        """POST the gear query straight to XenForo and return the results URL.
+
+        Returns None when the site refuses plain HTTP clients, so the caller can fall back to the browser.
+        """
+        # the _xfToken is tied to this visit's cookies, so never answer the search from cache
+        session = _get_session()
+        with session.cache_disabled() if requests_cache is not None else nullcontext():
+            try:
+                form_response = session.get(self.SEARCH_URL, headers=self.DEFAULT_HEADERS, timeout=self.timeout * 5)
+                form_response.raise_for_status()
+                token_elem = make_soup(form_response.text).select_one("input[name='_xfToken']")
+                if token_elem is None:
+                    return None
+
+                response = session.post(
+                    self.SEARCH_POST_URL,
+                    headers=self.DEFAULT_HEADERS,
+                    data={
+                        "keywords": self.gear_query,
+                        "_xfToken": token_elem.get("value", ""),
+                        "c[title_only]": 0,
+                        "o": "relevance",
+                    },
+                    timeout=self.timeout * 5,
+                    allow_redirects=True,
+                )
+                response.raise_for_status()
+            except requests.RequestException:
+                return None
+
+        if not re.search(r"search/\d+", response.url):
+            return None
+        return response.url
+
+    def copy_session_cookies(self) -> None:
+        """Hand the cookies from the HTTP search over to the browser."""
+
+        # add_cookie only works once the browser is on the site, CDP lets us set them before the first load
+        for cookie in _get_session().cookies:
+            params = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": cookie.secure,
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            if cookie.expires is not None:
+                params["expires"] = cookie.expires
+            self.driver.execute_cdp_cmd("Network.setCookie", params)
+
     def perform_search(self) -> list[str]:
-        """Fill the search box with the gear query and click search."""
+        """Run the gear query and collect the result links."""
+        results_url = self.submit_search()
+        if results_url is not None:
+            self.copy_session_cookies()
+            self.driver.get(results_url)
+            return self.gather_hrefs()
+
+        # plain HTTP got blocked, so submit the search form in the browser
         self.open_search_page()
         wait = WebDriverWait(self.driver, self.timeout)
 
         try:
             # why does this not work when headless?
             search_input = wait.until(
-                EC.presence_of_element_located((By.XPATH, '/html/body/div[1]/div[2]/div[2]/div[4]/div/div[3]/div[2]/div[2]/form/div/div/dl[1]/dd/ul/li[1]/input'))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='keywords']"))
             )
         except TimeoutException as exc:
             raise RuntimeError("Search input not found.") from exc
-        search_input.send_keys(self.gear_query)
-        # this is the button part and quite honestly i have no idea how this works, cuz it just sends something and it searches itself
-        # starting from there? i have no idea, i thought it was suppose to press the button but i guess not either way it works so ima
-        # move on, if it doesnt work in the future cuz the search button isn't being pressed, do this part
-
-        self.press_search_button(wait)
-        time.sleep(5)
+        # set the value and submit the enclosing form in one round trip instead of typing and clicking
+        self.driver.execute_script(
+            "arguments[0].value = arguments[1]; arguments[0].form.submit();",
+            search_input,
+            self.gear_query,
+        )
+        # the form page is already under search/, so wait for the numbered results URL
+        WebDriverWait(self.driver, 10).until(EC.url_matches(r"search/\d+"))
 
         return self.gather_hrefs()
 
-    def press_search_button(self, wait) -> None:
-        try:
-            search_button = self.driver.find_element(By.XPATH, '/html/body/div[1]/div[2]/div[2]/div[4]/div/div[3]/div[2]/div[2]/form/div/dl/dd/div/div[2]/button')
-        except NoSuchElementException as exc:
-            raise RuntimeError("Search button not found.") from exc
-
-        wait.until(EC.element_to_be_clickable(search_button))
-        search_button.click()
-
-        
     def gather_hrefs(self) -> list[str]:
         """Collect hrefs inside '.block-body' sections, optionally bounded by max_results."""
         contentRow = WebDriverWait(self.driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "block-container")))
-        all_links = contentRow.find_elements(By.TAG_NAME, "a")
-        links = []
-        for link in all_links:
-            links.append(link.get_attribute("href"))
-
-        return links
+        # one round trip for every href instead of one get_attribute call per link
+        return self.driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll('a'))"
+            ".map(a => a.hasAttribute('href') ? a.href : null);",
+            contentRow,
+        )
     
     def gather_data_from_post(self, link):
         """Takes link as input and gathers the information from that post and format into json"""
-        response = requests.get(link, headers=self.DEFAULT_HEADERS, timeout=self.timeout * 5)
+        response = _get_session().get(link, headers=self.DEFAULT_HEADERS, timeout=self.timeout * 5)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        first_post = soup.select_one("article.message")
-        title_elem = soup.select_one("h1.p-title-value")
-        author_elem = first_post.select_one("a.username") if first_post else None
-        time_elem = first_post.select_one("time.u-dt") if first_post else None
-        body_elem = first_post.select_one(".bbWrapper") if first_post else None
+        return self._parse_post_html(link, response.text)
+
+    async def gather_data_from_posts(self, links: list[str | None]) -> list[dict | Exception | None]:
+        """Fetch several posts concurrently, falling back to the jina snapshot for blocked pages.
+
+        Results line up with links: empty links give None and a failed fetch gives the exception it raised.
+        """
+
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(16)
+
+        async def fetch(link: str | None) -> dict | None:
+            if not link:
+                return None
+            async with sem:
+                return await loop.run_in_executor(None, lambda: self.fetch_post(link, timeout=self.timeout * 5))
+
+        return await asyncio.gather(*(fetch(link) for link in links), return_exceptions=True)
+
+    @staticmethod
+    def _parse_post_html(link: str, markup: str) -> dict:
+        """Pull the first post of a thread page into the payload dict."""
+
+        soup = make_soup(markup)
+        first_post = _SEL_POST.select_one(soup)
+        title_elem = _SEL_TITLE.select_one(soup)
+        author_elem = _SEL_AUTHOR.select_one(first_post) if first_post else None
+        time_elem = _SEL_TIME.select_one(first_post) if first_post else None
+        body_elem = _SEL_BODY.select_one(first_post) if first_post else None
 
         return {
             "url": link,
@@ -105,13 +313,13 @@ class GearSearchScraper:
             "posted_on": time_elem.get("datetime") if time_elem else None,
             "content": body_elem.get_text("\n", strip=True) if body_elem else None,
         }
-        return
 
     @classmethod
     def fetch_post_markup(cls, url: str, *, timeout: int = 30) -> tuple[str, str]:
         """Return the markup body and the source type ('html' or 'snapshot')."""
 
-        response = requests.get(url, headers=cls.DEFAULT_HEADERS, timeout=timeout)
+        session = _get_session()
+        response = session.get(url, headers=cls.DEFAULT_HEADERS, timeout=timeout)
         try:
             response.raise_for_status()
             return response.text, "html"
@@ -120,56 +328,65 @@ class GearSearchScraper:
                 raise
 
         fallback_url = f"https://r.jina.ai/{requests.utils.requote_uri(url)}"
-        fallback_response = requests.get(fallback_url, timeout=timeout * 2)
+        fallback_response = session.get(fallback_url, timeout=timeout * 2)
         fallback_response.raise_for_status()
         return fallback_response.text, "snapshot"
 
-    @staticmethod
-    def parse_snapshot(url: str, text_snapshot: str) -> dict:
+    @classmethod
+    def fetch_post(cls, url: str, *, timeout: int = 30) -> dict:
+        """Fetch a thread and parse its first post from whichever markup the site gave us."""
+
+        markup, source_type = cls.fetch_post_markup(url, timeout=timeout)
+        if source_type == "html":
+            return cls._parse_post_html(url, markup)
+        return cls.parse_snapshot(url, markup)
+
+    @classmethod
+    def parse_snapshot(cls, url: str, text_snapshot: str) -> dict:
         """Parse the plaintext snapshot served by r.jina.ai if the site blocks us."""
 
         payload = {"url": url, "title": None, "author": None, "posted_on": None, "content": None}
         lines = [line.strip() for line in text_snapshot.splitlines()]
 
-        for line in lines:
-            if line.startswith("Title:"):
+        # one walk over the lines: pre_author -> in_author -> in_content -> done
+        state = "pre_author"
+        seen_title = seen_posted = False
+        author_block_index = content_start = content_end = fallback_end = None
+        for idx, line in enumerate(lines):
+            if not seen_title and line.startswith("Title:"):
                 payload["title"] = line.split("Title:", 1)[1].strip() or None
-                break
-
-        for line in lines:
-            if line.startswith("Published Time:"):
+                seen_title = True
+            elif not seen_posted and line.startswith("Published Time:"):
                 payload["posted_on"] = line.split("Published Time:", 1)[1].strip() or None
-                break
+                seen_posted = True
 
-        author_block_index = None
-        for idx, line in enumerate(lines):
-            if line.startswith("#### ["):
-                match = re.search(r"\[(.*?)\]", line)
+            if state == "pre_author":
+                if not line.startswith("#### ["):
+                    continue
+                match = cls._AUTHOR_RE.search(line)
                 if match:
                     payload["author"] = match.group(1).strip()
                 author_block_index = idx
-                break
+                state = "in_author"
 
-        if author_block_index is not None:
-            content_start = None
-            for idx in range(author_block_index, len(lines)):
-                if "[#1]" in lines[idx]:
+            if state == "in_author":
+                if "[#1]" in line:
                     content_start = idx + 2
-                    break
-            if content_start is None:
-                content_start = author_block_index
-
-            content_end = len(lines)
-            for idx in range(content_start, len(lines)):
-                if idx == content_start:
-                    continue
-                if lines[idx].startswith("#### ["):
+                    state = "in_content"
+                elif fallback_end is None and idx > author_block_index and line.startswith(("#### [", "Share:")):
+                    # only used if the post never shows a [#1] marker
+                    fallback_end = idx
+            elif state == "in_content":
+                if idx > content_start and line.startswith(("#### [", "Share:")):
                     content_end = idx
-                    break
-                if lines[idx].startswith("Share:"):
-                    content_end = idx
-                    break
+                    state = "done"
+
+            if state == "done" and seen_title and seen_posted:
+                break
 
+        if author_block_index is not None:
+            if content_start is None:
+                content_start, content_end = author_block_index, fallback_end
             payload["content"] = "\n".join(lines[content_start:content_end]).strip() or None
 
         return payload
@@ -178,23 +395,6 @@ class GearSearchScraper:
 if __name__ == "__main__":
     target_link = "https://www.thegearpage.net/board/index.php?threads/2025-prs-silver-sky-tungsten.2713931/"
 
-    markup, source_type = GearSearchScraper.fetch_post_markup(target_link)
-    if source_type == "html":
-        soup = BeautifulSoup(markup, "html.parser")
-        first_post = soup.select_one("article.message")
-        title_elem = soup.select_one("h1.p-title-value")
-        author_elem = first_post.select_one("a.username") if first_post else None
-        time_elem = first_post.select_one("time.u-dt") if first_post else None
-        body_elem = first_post.select_one(".bbWrapper") if first_post else None
-
-        post_payload = {
-            "url": target_link,
-            "title": title_elem.get_text(strip=True) if title_elem else None,
-            "author": author_elem.get_text(strip=True) if author_elem else None,
-            "posted_on": time_elem.get("datetime") if time_elem else None,
-            "content": body_elem.get_text("\n", strip=True) if body_elem else None,
-        }
-    else:
-        post_payload = GearSearchScraper.parse_snapshot(target_link, markup)
+    post_payload = GearSearchScraper.fetch_post(target_link)
 
     print(json.dumps(post_payload, indent=2))
@@ -0,0 +1,65 @@
+import pytest
+
+data_scraper = pytest.importorskip("data_scraper")
+parse_snapshot = data_scraper.GearSearchScraper.parse_snapshot
+
+
+def test_parse_snapshot_crlf():
+    snapshot = (
+        "Title: Silver Sky\r\n"
+        "Published Time: 2024-01-02\r\n"
+        "#### [kriso77](https://example.com/members/1)\r\n"
+        "[#1](https://example.com/post-1)\r\n"
+        "\r\n"
+        "Love this guitar.\r\n"
+        "Second line.\r\n"
+        "#### [tyler](https://example.com/members/2)\r\n"
+        "reply"
+    )
+
+    assert parse_snapshot("u", snapshot) == {
+        "url": "u",
+        "title": "Silver Sky",
+        "author": "kriso77",
+        "posted_on": "2024-01-02",
+        "content": "Love this guitar.\nSecond line.",
+    }
+
+
+def test_parse_snapshot_splits_on_all_line_separators():
+    snapshot = (
+        "Title: Silver Sky\r"
+        "Published Time: 2024-01-02\u2028"
+        "#### [kriso77](x)\x85"
+        "[#1](y)\x0b"
+        "skipped\x0c"
+        "Love this guitar.\u2029"
+        "Share: Facebook"
+    )
+
+    assert parse_snapshot("u", snapshot) == {
+        "url": "u",
+        "title": "Silver Sky",
+        "author": "kriso77",
+        "posted_on": "2024-01-02",
+        "content": "Love this guitar.",
+    }
+
+
+def test_parse_snapshot_without_post_marker_reads_from_author_block():
+    snapshot = "Title: Silver Sky\n#### [kriso77](x)\nFirst body line\nSecond body line\nShare: Facebook\nfooter"
+
+    payload = parse_snapshot("u", snapshot)
+
+    assert payload["author"] == "kriso77"
+    assert payload["posted_on"] is None
+    assert payload["content"] == "#### [kriso77](x)\nFirst body line\nSecond body line"
+
+
+def test_parse_snapshot_empty_title_is_not_replaced_by_later_title():
+    snapshot = "Title:\nTitle: Second\nPublished Time: 2024-01-02\n#### [kriso77](x)\n[#1]\n\nBody\n#### [other](y)"
+
+    payload = parse_snapshot("u", snapshot)
+
+    assert payload["title"] is None
+    assert payload["content"] == "Body"